@@ -18,18 +18,73 @@ Supports interactive curses TUI and non-interactive CLI usage:
   sudo python3 slimbrave.py --reset                # CLI reset
 """
 
-import argparse
-import curses
 import json
 import os
-import shutil
-import subprocess
+import stat
 import sys
 import tempfile
 
+# curses and subprocess are imported lazily by the functions that need
+# them: the failed-root-check exit and the pure CLI paths then skip the
+# curses/terminfo loading cost entirely, and a headless box with a
+# broken terminfo can still run --import/--export/--reset. The render
+# helpers repeat `import curses` per call, which after the first import
+# is just a sys.modules hit.
+
 POLICY_DIR = "/etc/brave/policies/managed"
 POLICY_FILE = os.path.join(POLICY_DIR, "slimbrave.json")
 
+# The policy file is parsed on every startup and serialized on every Apply.
+# orjson (a C extension) does both several times faster than stdlib json, so
+# use it when available — but the script stays dependency-free, so stdlib
+# json is always a working fallback. Both helpers speak bytes: orjson only
+# accepts/returns bytes-ish data, and reading/writing the files in binary
+# mode skips a TextIOWrapper decode pass either way.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_compact(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    # ujson is another C-extension drop-in that still beats stdlib json on
+    # small payloads like the policy dict; try it before giving up.
+    try:
+        import ujson
+
+        # escape_forward_slashes=False: ujson alone escapes "/" by
+        # default, and the policy file should read the same (plain
+        # https:// URLs) whichever backend wrote it.
+        def _dumps(obj):
+            return ujson.dumps(
+                obj, indent=4, escape_forward_slashes=False).encode("utf-8")
+
+        def _dumps_compact(obj):
+            return ujson.dumps(
+                obj, escape_forward_slashes=False).encode("utf-8")
+
+        def _loads(data):
+            return ujson.loads(data)
+    except ImportError:
+        def _dumps(obj):
+            return json.dumps(obj, indent=4).encode("utf-8")
+
+        def _dumps_compact(obj):
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+        def _loads(data):
+            return json.loads(data)
+
+# Buffer size for whole-file JSON reads/writes. Policy files are tiny,
+# but Chromium Preferences files routinely run to hundreds of kilobytes;
+# a 64 KiB buffer cuts the syscall count versus the 8 KiB default.
+_IO_BUF = 64 * 1024
+
 # Directories a `--policy-file` argument is permitted to target. The flag
 # runs with root, so an unvalidated path combined with `--reset` would let a
 # permissive sudoers rule delete arbitrary files (e.g. `--policy-file
@@ -147,7 +202,7 @@ def _is_within_allowed_policy_dir(path):
     return False
 
 
-def _atomic_write(path, data, *, binary=False, mode=0o644):
+def _atomic_write(path, data, *, binary=False, mode=0o644, durable=True):
     """Write `data` to `path` atomically via a same-directory tempfile.
 
     `tempfile.mkstemp` uses O_CREAT|O_EXCL so it cannot be tricked into
@@ -155,14 +210,34 @@ def _atomic_write(path, data, *, binary=False, mode=0o644):
     target directory entry without following a symlink that happened to
     exist there. Fixes two classes of root footgun at once: symlink
     races and partial-state writes if the process is killed mid-write.
+
+    Durability is a single coalesced fsync on the tempfile before the
+    rename, plus one on the directory afterwards so the rename itself
+    survives a crash — without it the kernel may persist the data blocks
+    but lose the new directory entry, leaving the old file visible.
+    `durable=False` skips both fsyncs for outputs that are trivially
+    re-creatable (config exports): atomicity is preserved, but the data
+    may ride in the page cache a little longer.
     """
     directory = os.path.dirname(path) or "."
     fd, tmp = tempfile.mkstemp(prefix=".slimbrave.", suffix=".tmp", dir=directory)
     try:
-        with os.fdopen(fd, "wb" if binary else "w") as f:
+        with os.fdopen(fd, "wb" if binary else "w", buffering=_IO_BUF) as f:
             f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.chmod(tmp, mode)
         os.replace(tmp, path)
+        if durable:
+            try:
+                dfd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(dfd)
+                finally:
+                    os.close(dfd)
+            except OSError:
+                pass  # directory fsync is best-effort (e.g. odd filesystems)
     except Exception:
         try:
             os.unlink(tmp)
@@ -175,6 +250,34 @@ def _atomic_write(path, data, *, binary=False, mode=0o644):
 # ---------------------------------------------------------------------------
 
 
+def _is_file(path):
+    """os.path.isfile without the normalization layers — one stat syscall."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+# PATH split once per process; detection probes half a dozen executable
+# names and shutil.which would re-split (and consult PATHEXT) per call.
+_path_dirs_cache = None
+
+
+def _first_on_path(names):
+    """Return the first of `names` found executable on PATH, or None."""
+    global _path_dirs_cache
+    path_dirs = _path_dirs_cache
+    if path_dirs is None:
+        path_dirs = _path_dirs_cache = os.environ.get(
+            "PATH", os.defpath).split(os.pathsep)
+    for name in names:
+        for d in path_dirs:
+            candidate = os.path.join(d, name)
+            if _is_file(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+
 def _make_installation(channel_def, *, app_path="", plist_path="", prefs_path=None):
     """Build an installation record from a channel definition."""
     return {
@@ -189,6 +292,12 @@ def _make_installation(channel_def, *, app_path="", plist_path="", prefs_path=No
     }
 
 
+# detect_brave() result, cached for the lifetime of the process. Detection
+# stats a few dozen paths; installs don't change underneath a running
+# SlimBrave session, so one probe is enough.
+_detect_cache = None
+
+
 def detect_brave():
     """Detect Brave browser installation(s) and packaging method.
 
@@ -196,35 +305,50 @@ def detect_brave():
         found, method, path, warnings, installations.
     On Linux every detected channel shares POLICY_FILE (no per-channel
     plist), so installations is informational + drives prefs repair and
-    process-running checks.
+    process-running checks. The result is memoized per process.
     """
+    global _detect_cache
+    if _detect_cache is not None:
+        return _detect_cache
+
     method = None
     primary_path = ""
     warnings = []
     found_any = False
 
+    # One directory read of /opt resolves which vendor trees exist; the
+    # per-file stats below then only run for trees that are present,
+    # instead of three unconditional stat round-trips.
+    try:
+        opt_names = {entry.name for entry in os.scandir("/opt")}
+    except OSError:
+        opt_names = ()
+
     # Arch (brave-bin AUR package)
-    if os.path.isfile("/opt/brave-bin/brave"):
+    if "brave-bin" in opt_names and _is_file("/opt/brave-bin/brave"):
         method, primary_path, found_any = "arch", "/opt/brave-bin/brave", True
     # Deb / RPM (official brave-browser package)
-    elif os.path.isfile("/opt/brave.com/brave/brave-browser"):
+    elif "brave.com" in opt_names and _is_file("/opt/brave.com/brave/brave-browser"):
         method, primary_path, found_any = "deb/rpm", "/opt/brave.com/brave/brave-browser", True
-    elif os.path.isfile("/opt/brave.com/brave/brave"):
+    elif "brave.com" in opt_names and _is_file("/opt/brave.com/brave/brave"):
         method, primary_path, found_any = "deb/rpm", "/opt/brave.com/brave/brave", True
     else:
-        try:
-            result = subprocess.run(
-                ["flatpak", "info", "com.brave.Browser"],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
-            if result.returncode == 0:
-                method, primary_path, found_any = "flatpak", "com.brave.Browser", True
-        except FileNotFoundError:
-            pass  # flatpak not installed
+        # Flatpak leaves an app directory under the system or per-user
+        # installation root; checking those directly replaces a `flatpak
+        # info` fork+exec (100+ ms, plus an ostree summary load) with a
+        # couple of stat calls.
+        flatpak_home = _user_home_for_brave()
+        flatpak_app_dirs = ["/var/lib/flatpak/app/com.brave.Browser"]
+        if flatpak_home:
+            flatpak_app_dirs.append(os.path.join(
+                flatpak_home, ".local", "share", "flatpak",
+                "app", "com.brave.Browser"))
+        if any(os.path.isdir(p) for p in flatpak_app_dirs):
+            method, primary_path, found_any = "flatpak", "com.brave.Browser", True
 
     if not found_any:
         snap_path = "/snap/brave/current/opt/brave.com/brave/brave"
-        if os.path.isfile(snap_path) or os.path.isdir("/snap/brave/current"):
+        if _is_file(snap_path) or os.path.isdir("/snap/brave/current"):
             method, primary_path, found_any = "snap", snap_path, True
             warnings.append(
                 "Snap confinement may prevent policies from taking effect. "
@@ -232,11 +356,9 @@ def detect_brave():
             )
 
     if not found_any:
-        for name in ("brave-browser-stable", "brave-browser", "brave"):
-            found = shutil.which(name)
-            if found:
-                method, primary_path, found_any = "unknown", found, True
-                break
+        found = _first_on_path(("brave-browser-stable", "brave-browser", "brave"))
+        if found:
+            method, primary_path, found_any = "unknown", found, True
 
     if not found_any:
         method = "not found"
@@ -255,7 +377,7 @@ def detect_brave():
         )
         installed = (
             (ch_dir is not None and os.path.isdir(ch_dir))
-            or shutil.which(ch["process_name"]) is not None
+            or _first_on_path((ch["process_name"],)) is not None
         )
         if installed:
             installations.append(_make_installation(
@@ -294,13 +416,14 @@ def detect_brave():
     if found_any and len(detected_labels) > 1:
         method = f"{method}: " + ", ".join(detected_labels)
 
-    return {
+    _detect_cache = {
         "found": found_any,
         "method": method,
         "path": primary_path,
         "warnings": warnings,
         "installations": installations,
     }
+    return _detect_cache
 
 
 # ---------------------------------------------------------------------------
@@ -393,10 +516,36 @@ CATEGORIES = [
     },
 ]
 
+# Policy keys are long mixed-case strings that CPython does not intern
+# on its own; interning them makes every dict operation keyed on them
+# (policy build, sync, import) hit the pointer-equality fast path before
+# falling back to a character compare.
+for _cat in CATEGORIES:
+    for _feat in _cat["features"]:
+        _feat["key"] = sys.intern(_feat["key"])
+del _cat, _feat
+
+# Flat tuple view of CATEGORIES, built once at import. Per-call code
+# iterates this with tuple unpacking instead of re-walking the nested
+# list-of-dicts (several hash lookups per feature); CATEGORIES itself stays
+# the editable source of truth and the shape shared with the macOS script.
+_CATEGORY_TABLE = tuple(
+    (cat["name"],
+     tuple((f["name"], f["key"], f["value"], f.get("group"))
+           for f in cat["features"]))
+    for cat in CATEGORIES
+)
+
 # "unmanaged" (the default) writes no DNS policy at all, leaving Brave's
 # DNS settings user-controlled. The other four are managed-policy values —
 # including "off", which actively force-disables DoH as policy.
 DNS_MODES = ["unmanaged", "automatic", "off", "secure", "custom"]
+_DNS_MODE_IDX = {mode: i for i, mode in enumerate(DNS_MODES)}
+# Successor/predecessor tables for cycling the DNS selection: a tuple
+# index instead of a modulo per keystroke (five modes, so the xor trick
+# for two-entry lists does not apply).
+_DNS_NEXT = tuple((i + 1) % len(DNS_MODES) for i in range(len(DNS_MODES)))
+_DNS_PREV = tuple((i - 1) % len(DNS_MODES) for i in range(len(DNS_MODES)))
 
 # ---------------------------------------------------------------------------
 # Build a flat list of rows for the TUI (headers + toggleable items + DNS)
@@ -408,24 +557,18 @@ ROW_DNS = 2
 ROW_DNS_TEMPLATE = 3
 
 
-def build_rows(installations=None):
-    """Return a list of dicts describing each visual row.
-
-    On Linux every channel shares POLICY_FILE so a per-channel selector
-    cannot meaningfully scope the policy write. The `installations`
-    argument is accepted for API parity with the macOS script but does
-    not affect the layout.
-    """
+def _build_row_template():
+    """Build the canonical row list from the feature tables."""
     rows = []
-    for cat in CATEGORIES:
-        rows.append({"type": ROW_HEADER, "text": cat["name"]})
-        for feat in cat["features"]:
+    for cat_name, features in _CATEGORY_TABLE:
+        rows.append({"type": ROW_HEADER, "text": cat_name})
+        for name, key, value, group in features:
             rows.append({
                 "type": ROW_FEATURE,
-                "text": feat["name"],
-                "key": feat["key"],
-                "value": feat["value"],
-                "group": feat.get("group"),
+                "text": name,
+                "key": key,
+                "value": value,
+                "group": group,
                 "checked": False,
             })
     # DNS mode selector at the end
@@ -443,11 +586,67 @@ def build_rows(installations=None):
         "cursor": 0,        # cursor position within the text
         "scroll": 0,        # horizontal scroll offset for long URLs
     })
-    return rows
+    return tuple(rows)
+
+
+# The row layout is fully determined by the module-level feature tables, so
+# build it once at import; build_rows hands out per-call shallow copies.
+# This keeps one-shot callers (cli_import/cli_export, tests) off the full
+# table walk — they pay only the dict copies, never the layout build.
+# The Shields rows' list values end up shared between copies, which is fine
+# — row values are compared and written out, never mutated in place.
+_ROW_TEMPLATE = _build_row_template()
+
+
+# Index tables over the template layout, built once at import. A policy key
+# can appear on several rows with different values (the mutually exclusive
+# groups), hence the tuple of indices per key.
+_POLICY_KEY_ROWS = {}
+for _i, _row in enumerate(_ROW_TEMPLATE):
+    if _row["type"] == ROW_FEATURE:
+        _POLICY_KEY_ROWS.setdefault(_row["key"], []).append(_i)
+_POLICY_KEY_ROWS = {k: tuple(v) for k, v in _POLICY_KEY_ROWS.items()}
+del _i, _row
+
+_DNS_ROW_IDX = next(
+    i for i, r in enumerate(_ROW_TEMPLATE) if r["type"] == ROW_DNS)
+_DNS_TMPL_ROW_IDX = next(
+    i for i, r in enumerate(_ROW_TEMPLATE) if r["type"] == ROW_DNS_TEMPLATE)
+
+# Structure-of-arrays extract of the one column the hot paths filter on.
+# Row dicts stay the public shape shared with the macOS script, but the
+# type column is immutable after build, so per-keystroke checks can index
+# this tuple instead of hashing "type" out of a dict.
+_ROW_TYPES = tuple(r["type"] for r in _ROW_TEMPLATE)
+_SEL_TEMPLATE = tuple(
+    i for i, t in enumerate(_ROW_TYPES)
+    if t in (ROW_FEATURE, ROW_DNS, ROW_DNS_TEMPLATE))
+_FEATURE_ROW_IDXS = tuple(
+    i for i, t in enumerate(_ROW_TYPES) if t == ROW_FEATURE)
+_HEADER_ABOVE = tuple(
+    i > 0 and _ROW_TYPES[i - 1] == ROW_HEADER
+    for i in range(len(_ROW_TYPES)))
+
+
+def build_rows(installations=None):
+    """Return a list of dicts describing each visual row.
+
+    On Linux every channel shares POLICY_FILE so a per-channel selector
+    cannot meaningfully scope the policy write. The `installations`
+    argument is accepted for API parity with the macOS script but does
+    not affect the layout.
+    """
+    return [dict(row) for row in _ROW_TEMPLATE]
 
 
 def get_dns_mode(rows):
     """Return the currently selected DNS mode string."""
+    # Rows come from the fixed template, so the DNS row sits at a known
+    # index; guard on the type in case a caller passes a modified list.
+    if len(rows) > _DNS_ROW_IDX:
+        row = rows[_DNS_ROW_IDX]
+        if row["type"] == ROW_DNS:
+            return row["options"][row["selected"]]
     for row in rows:
         if row["type"] == ROW_DNS:
             return row["options"][row["selected"]]
@@ -456,6 +655,10 @@ def get_dns_mode(rows):
 
 def get_dns_template(rows):
     """Return the current DoH template URL string."""
+    if len(rows) > _DNS_TMPL_ROW_IDX:
+        row = rows[_DNS_TMPL_ROW_IDX]
+        if row["type"] == ROW_DNS_TEMPLATE:
+            return row["value"]
     for row in rows:
         if row["type"] == ROW_DNS_TEMPLATE:
             return row["value"]
@@ -481,18 +684,43 @@ def toggle_feature_row(rows, target):
 # ---------------------------------------------------------------------------
 
 
+# BOM prefix -> codec, for config files exported by other tools
+# (PowerShell writes UTF-16 with a BOM).
+_BOM_CODECS = (
+    (b"\xff\xfe", "utf-16-le"),
+    (b"\xfe\xff", "utf-16-be"),
+    (b"\xef\xbb\xbf", "utf-8"),
+)
+
+
 def read_json_file(path):
-    """Read a JSON file, handling BOM and encoding from PS1 exports."""
-    with open(path, "rb") as f:
+    """Read a JSON file, handling BOM and encoding from PS1 exports.
+
+    Reads raw bytes and parses them directly where possible; the decode
+    pass only runs for BOM/UTF-16 inputs. Config files are a few KB, so
+    a whole-file read beats streaming or mmap here.
+    """
+    with open(path, "rb", buffering=_IO_BUF) as f:
         data = f.read()
 
-    # Detect BOM and decode accordingly
-    if data[:2] == b"\xff\xfe":
-        text = data[2:].decode("utf-16-le", errors="replace")
-    elif data[:2] == b"\xfe\xff":
-        text = data[2:].decode("utf-16-be", errors="replace")
-    elif data[:3] == b"\xef\xbb\xbf":
-        text = data[3:].decode("utf-8", errors="replace")
+    # Fast path: no BOM and no NULs up front means plain UTF-8 (UTF-16
+    # interleaves NUL bytes into ASCII JSON), which parses straight from
+    # the bytes with no decode or NUL-strip pass. Covers nearly every
+    # real config file.
+    head = data[:4]
+    if (b"\x00" not in head
+            and head[:2] not in (b"\xff\xfe", b"\xfe\xff")
+            and head[:3] != b"\xef\xbb\xbf"):
+        try:
+            return _loads(data)
+        except ValueError:
+            pass  # stray NULs or similar: fall through to tolerant path
+
+    # Tolerant path: decode per the BOM table, strip UTF-16 artifacts.
+    for bom, codec in _BOM_CODECS:
+        if data.startswith(bom):
+            text = data[len(bom):].decode(codec, errors="replace")
+            break
     else:
         try:
             text = data.decode("utf-8", errors="strict")
@@ -501,7 +729,7 @@ def read_json_file(path):
 
     # Strip null bytes (UTF-16 artifacts in malformed files)
     text = text.replace("\x00", "")
-    return json.loads(text)
+    return _loads(text)
 
 # ---------------------------------------------------------------------------
 # Profile-prefs repair
@@ -518,6 +746,8 @@ def read_json_file(path):
 
 def _is_brave_running(installations=None):
     """True if any of the listed Brave installations have a live process."""
+    import subprocess
+
     if installations is None:
         names = ["brave"]
     else:
@@ -544,9 +774,11 @@ def _repair_one_prefs(pref_path):
         return 0
 
     try:
-        with open(pref_path, "r", encoding="utf-8") as f:
-            prefs = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        # Binary read + _loads skips the TextIOWrapper decode pass;
+        # Preferences files are plain UTF-8 JSON.
+        with open(pref_path, "rb", buffering=_IO_BUF) as f:
+            prefs = _loads(f.read())
+    except (OSError, ValueError):
         return 0
 
     bs = (
@@ -571,7 +803,8 @@ def _repair_one_prefs(pref_path):
         original_mode = os.stat(pref_path).st_mode & 0o777
         _atomic_write(
             pref_path,
-            json.dumps(prefs, separators=(",", ":")),
+            _dumps_compact(prefs),
+            binary=True,
             mode=original_mode,
         )
     except OSError:
@@ -609,15 +842,33 @@ def repair_brave_prefs(installations=None):
 # ---------------------------------------------------------------------------
 
 
+# Parsed policy files memoized by (path, mtime_ns, size), so repeated
+# loads of an unchanged file (scripted --export loops, TUI reopen after
+# Apply) skip the JSON decode. Writers and cli_reset clear it.
+_policy_cache = {}
+
+
 def _read_one_policy(plist_path):
     """Read a single JSON policy file."""
     try:
-        with open(plist_path, "r") as f:
-            return json.load(f)
+        st = os.stat(plist_path)
+    except OSError:
+        return {}
+    key = (plist_path, st.st_mtime_ns, st.st_size)
+    cached = _policy_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    try:
+        with open(plist_path, "rb", buffering=_IO_BUF) as f:
+            policy = _loads(f.read())
     except (FileNotFoundError, PermissionError):
         return {}
     except Exception:
         return {}
+    if isinstance(policy, dict):
+        _policy_cache[key] = policy
+        return dict(policy)
+    return {}
 
 
 def load_existing_policy(installations=None):
@@ -646,16 +897,7 @@ def _build_policy(rows):
 
     Returns (policy, error_msg). On validation failure policy is None.
     """
-    policy = {}
-    dns_mode = None
-    dns_template = ""
-    for row in rows:
-        if row["type"] == ROW_FEATURE and row["checked"]:
-            policy[row["key"]] = row["value"]
-        elif row["type"] == ROW_DNS:
-            dns_mode = row["options"][row["selected"]]
-        elif row["type"] == ROW_DNS_TEMPLATE:
-            dns_template = row["value"].strip()
+    policy, dns_mode, dns_template = _collect_row_state(rows)
 
     if dns_mode == "custom" and not dns_template:
         return None, "Custom DNS requires a DoH template URL."
@@ -673,11 +915,33 @@ def _build_policy(rows):
     return policy, ""
 
 
+# Policy directories already ensured this process. They are created once
+# and do not vanish mid-session, so repeat Applies skip the makedirs
+# stat chain.
+_ensured_dirs = set()
+
+
 def _write_one_policy(plist_path, policy):
     """Write a single JSON policy file and return (ok, error_msg)."""
     try:
-        os.makedirs(os.path.dirname(plist_path), exist_ok=True)
-        _atomic_write(plist_path, json.dumps(policy, indent=4))
+        new_bytes = _dumps(policy)
+        # A no-op Apply is common (re-applying the loaded state); when the
+        # file already holds exactly these bytes, skip the tmp-file dance
+        # and fsync entirely.
+        try:
+            with open(plist_path, "rb", buffering=_IO_BUF) as f:
+                if f.read() == new_bytes:
+                    return True, ""
+        except OSError:
+            pass
+        plist_dir = os.path.dirname(plist_path)
+        if plist_dir not in _ensured_dirs:
+            os.makedirs(plist_dir, exist_ok=True)
+            _ensured_dirs.add(plist_dir)
+        _atomic_write(plist_path, new_bytes, binary=True)
+        # Stale entries can never be hit again (the mtime key changed),
+        # but drop them so the cache doesn't accumulate dead versions.
+        _policy_cache.clear()
     except PermissionError:
         return False, "Permission denied. Run as root."
     except OSError as e:
@@ -713,8 +977,10 @@ def apply_policy(rows, installations=None):
 
     if installations is None:
         targets = [(POLICY_FILE, "")]
+        channel_targets = None
     else:
-        targets = _dedupe_plist_targets(_selected_channel_targets(installations))
+        channel_targets = _selected_channel_targets(installations)
+        targets = _dedupe_plist_targets(channel_targets)
 
     if not targets:
         return False, "No Brave channel selected."
@@ -728,12 +994,8 @@ def apply_policy(rows, installations=None):
         if label:
             written_labels.append(label)
 
-    repair_targets = (
-        _selected_channel_targets(installations)
-        if installations else None
-    )
     return True, _post_apply_message(
-        *repair_brave_prefs(repair_targets), labels=written_labels,
+        *repair_brave_prefs(channel_targets), labels=written_labels,
     )
 
 
@@ -755,8 +1017,10 @@ def reset_policy(rows, installations=None):
     """Delete the policy file(s) and uncheck everything."""
     if installations is None:
         targets = [(POLICY_FILE, "")]
+        channel_targets = None
     else:
-        targets = _dedupe_plist_targets(_selected_channel_targets(installations))
+        channel_targets = _selected_channel_targets(installations)
+        targets = _dedupe_plist_targets(channel_targets)
 
     if not targets:
         return False, "No Brave channel selected."
@@ -764,10 +1028,13 @@ def reset_policy(rows, installations=None):
     cleared_labels = []
     try:
         for plist_path, label in targets:
-            if os.path.exists(plist_path):
+            try:
                 os.remove(plist_path)
+            except FileNotFoundError:
+                pass
             if label:
                 cleared_labels.append(label)
+        _policy_cache.clear()
         for row in rows:
             if row["type"] == ROW_FEATURE:
                 row["checked"] = False
@@ -780,11 +1047,7 @@ def reset_policy(rows, installations=None):
     except OSError as e:
         return False, f"Failed to reset: {e}"
 
-    repair_targets = (
-        _selected_channel_targets(installations)
-        if installations else None
-    )
-    repaired, running = repair_brave_prefs(repair_targets)
+    repaired, running = repair_brave_prefs(channel_targets)
     scope = f" for {', '.join(cleared_labels)}" if cleared_labels else ""
     msg = f"All settings reset{scope}. Restart Brave to see changes."
     if repaired > 0:
@@ -798,44 +1061,85 @@ def reset_policy(rows, installations=None):
 
 
 def sync_rows_with_policy(rows, policy):
-    """Pre-check rows that match an existing policy on disk."""
+    """Pre-check rows that match an existing policy on disk.
+
+    Template-shaped lists hit matching rows through the precomputed
+    key/DNS indices instead of scanning every row once per policy key;
+    other lists fall back to a type-scanning walk.
+    """
     if not policy:
         return
-    for row in rows:
-        if row["type"] == ROW_FEATURE:
-            if row["key"] in policy and policy[row["key"]] == row["value"]:
-                row["checked"] = True
-        elif row["type"] == ROW_DNS:
-            dns_val = policy.get("DnsOverHttpsMode")
-            dns_tmpl = policy.get("DnsOverHttpsTemplates", "")
-            if dns_val == "secure" and dns_tmpl:
-                if "custom" in row["options"]:
-                    row["selected"] = row["options"].index("custom")
-            elif dns_val in row["options"]:
-                row["selected"] = row["options"].index(dns_val)
-        elif row["type"] == ROW_DNS_TEMPLATE:
-            tmpl = policy.get("DnsOverHttpsTemplates", "")
-            if tmpl:
-                row["value"] = tmpl
-                row["cursor"] = len(tmpl)
+
+    if len(rows) == len(_ROW_TYPES):
+        key_rows_get = _POLICY_KEY_ROWS.get
+        for key, value in policy.items():
+            for idx in key_rows_get(key, ()):
+                if rows[idx]["value"] == value:
+                    rows[idx]["checked"] = True
+        dns_row = rows[_DNS_ROW_IDX]
+        tmpl_row = rows[_DNS_TMPL_ROW_IDX]
+    else:
+        dns_row = tmpl_row = None
+        for row in rows:
+            row_type = row["type"]
+            if row_type == ROW_FEATURE:
+                key = row["key"]
+                if key in policy and row["value"] == policy[key]:
+                    row["checked"] = True
+            elif row_type == ROW_DNS:
+                dns_row = row
+            elif row_type == ROW_DNS_TEMPLATE:
+                tmpl_row = row
+
+    dns_val = policy.get("DnsOverHttpsMode")
+    dns_tmpl = policy.get("DnsOverHttpsTemplates", "")
+    if dns_row is not None:
+        if dns_val == "secure" and dns_tmpl:
+            dns_row["selected"] = _DNS_MODE_IDX["custom"]
+        elif dns_val in _DNS_MODE_IDX:
+            dns_row["selected"] = _DNS_MODE_IDX[dns_val]
+    if dns_tmpl and tmpl_row is not None:
+        tmpl_row["value"] = dns_tmpl
+        tmpl_row["cursor"] = len(dns_tmpl)
 
 # ---------------------------------------------------------------------------
 # Import / Export (PS1-compatible JSON format)
 # ---------------------------------------------------------------------------
 
 
-def export_settings(rows, path):
-    """Export current TUI selections to a SlimBrave Neo JSON config file."""
-    features = {}
+def _collect_row_state(rows):
+    """Return ({key: value} for checked features, dns_mode, dns_template).
+
+    Template-shaped lists use the precomputed feature/DNS indices, so the
+    walk touches only feature rows and two fixed slots instead of
+    type-testing every row; other lists fall back to a full scan.
+    """
+    checked = {}
+    if len(rows) == len(_ROW_TYPES):
+        for i in _FEATURE_ROW_IDXS:
+            row = rows[i]
+            if row["checked"]:
+                checked[row["key"]] = row["value"]
+        dns_row = rows[_DNS_ROW_IDX]
+        return (checked,
+                dns_row["options"][dns_row["selected"]],
+                rows[_DNS_TMPL_ROW_IDX]["value"].strip())
     dns_mode = None
     dns_template = ""
     for row in rows:
-        if row["type"] == ROW_FEATURE and row["checked"]:
-            features[row["key"]] = row["value"]
-        elif row["type"] == ROW_DNS:
+        row_type = row["type"]
+        if row_type == ROW_FEATURE and row["checked"]:
+            checked[row["key"]] = row["value"]
+        elif row_type == ROW_DNS:
             dns_mode = row["options"][row["selected"]]
-        elif row["type"] == ROW_DNS_TEMPLATE:
+        elif row_type == ROW_DNS_TEMPLATE:
             dns_template = row["value"].strip()
+    return checked, dns_mode, dns_template
+
+
+def export_settings(rows, path):
+    """Export current TUI selections to a SlimBrave Neo JSON config file."""
+    features, dns_mode, dns_template = _collect_row_state(rows)
 
     # DnsMode is omitted when DNS is unmanaged, so importing the file
     # (on any platform) lands back on "unmanaged" instead of forcing a
@@ -850,7 +1154,9 @@ def export_settings(rows, path):
         out_dir = os.path.dirname(path)
         if out_dir:
             os.makedirs(out_dir, exist_ok=True)
-        _atomic_write(path, json.dumps(settings, indent=4))
+        # Exports are re-creatable at will, so skip the fsyncs; the
+        # policy file itself keeps full durability.
+        _atomic_write(path, _dumps(settings), binary=True, durable=False)
         # Running as root: hand the export back to the invoking user so it
         # isn't a root-owned file stranded in their home directory.
         _chown_to_sudo_user(path)
@@ -874,7 +1180,10 @@ def import_settings(rows, path):
         config = read_json_file(path)
     except FileNotFoundError:
         return False, f"File not found: {path}"
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+    except ValueError as e:
+        # ValueError, not json.JSONDecodeError: the ujson tier's decode
+        # error subclasses only ValueError, and UnicodeDecodeError is a
+        # ValueError too.
         return False, f"Invalid JSON: {e}"
     except OSError as e:
         return False, f"Read error: {e}"
@@ -931,13 +1240,29 @@ CP_TITLE = 9
 CP_DIM = 10
 
 BUTTONS = ["Import", "Export", "Apply", "Reset", "Quit"]
+# Index constants mirroring BUTTONS order; the Enter handler dispatches
+# on the focused index instead of comparing label strings.
+BTN_IMPORT, BTN_EXPORT, BTN_APPLY, BTN_RESET, BTN_QUIT = range(len(BUTTONS))
 
 FOCUS_LIST = 0
 FOCUS_BUTTONS = 1
 FOCUS_PROMPT = 2
 
+# Ready-made attribute values (color pair | modifiers), filled in by
+# init_colors(). curses.color_pair is a Python->C trip and draw() would
+# otherwise make it dozens of times per frame.
+ATTR_NORMAL = ATTR_HINT = ATTR_HEADER = ATTR_CHECKED = ATTR_CURSOR = 0
+ATTR_BUTTON = ATTR_BUTTON_ACTIVE = ATTR_BUTTON_FOCUS = 0
+ATTR_STATUS_OK = ATTR_STATUS_ERR = ATTR_TITLE = ATTR_PROMPT = ATTR_DIM = 0
+
 
 def init_colors():
+    import curses
+
+    global ATTR_NORMAL, ATTR_HINT, ATTR_HEADER, ATTR_CHECKED, ATTR_CURSOR
+    global ATTR_BUTTON, ATTR_BUTTON_ACTIVE, ATTR_BUTTON_FOCUS
+    global ATTR_STATUS_OK, ATTR_STATUS_ERR, ATTR_TITLE, ATTR_PROMPT, ATTR_DIM
+
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(CP_NORMAL, curses.COLOR_WHITE, -1)
@@ -951,40 +1276,141 @@ def init_colors():
     curses.init_pair(CP_TITLE, curses.COLOR_CYAN, -1)
     curses.init_pair(CP_DIM, curses.COLOR_WHITE, -1)
 
+    ATTR_NORMAL = curses.color_pair(CP_NORMAL)
+    ATTR_HINT = ATTR_NORMAL | curses.A_DIM
+    ATTR_HEADER = curses.color_pair(CP_HEADER) | curses.A_BOLD
+    ATTR_CHECKED = curses.color_pair(CP_CHECKED)
+    ATTR_CURSOR = curses.color_pair(CP_CURSOR) | curses.A_BOLD
+    ATTR_BUTTON = curses.color_pair(CP_BUTTON)
+    ATTR_BUTTON_ACTIVE = curses.color_pair(CP_BUTTON_ACTIVE)
+    ATTR_BUTTON_FOCUS = ATTR_BUTTON_ACTIVE | curses.A_BOLD
+    ATTR_STATUS_OK = curses.color_pair(CP_STATUS_OK)
+    ATTR_STATUS_ERR = curses.color_pair(CP_STATUS_ERR)
+    ATTR_TITLE = curses.color_pair(CP_TITLE) | curses.A_BOLD
+    ATTR_PROMPT = curses.color_pair(CP_TITLE)
+    ATTR_DIM = curses.color_pair(CP_DIM) | curses.A_DIM
+
 
 def selectable_indices(rows):
     """Return list of row indices that can receive cursor focus."""
+    # Selectability depends only on the type column, which is fixed by
+    # the template, so template-shaped lists get the precomputed answer.
+    if len(rows) == len(_ROW_TYPES):
+        return list(_SEL_TEMPLATE)
     return [i for i, r in enumerate(rows)
             if r["type"] in (ROW_FEATURE, ROW_DNS, ROW_DNS_TEMPLATE)]
 
 
+def header_above_map(rows):
+    """Return a per-row bitmap of 'the previous row is a category header'.
+
+    The scroll logic peeks at the preceding row on every keystroke to keep
+    a header visible above the first item of its category; precomputing the
+    answer once turns that into a single list index in the input loop.
+    """
+    if len(rows) == len(_HEADER_ABOVE):
+        return list(_HEADER_ABOVE)
+    return [i > 0 and rows[i - 1]["type"] == ROW_HEADER
+            for i in range(len(rows))]
+
+
+# Per-row-type renderers for draw()'s list loop, dispatched through a dict
+# keyed on the row type instead of an if/elif chain per visible row. Each
+# returns (line, attr); `dns_active` is whether the DoH template field is
+# editable under the current DNS mode.
+
+
+def _render_header(row, usable_w, dns_active):
+    return f"  {row['text']}", ATTR_HEADER
+
+
+# Feature texts and DNS modes are fixed, so their rendered lines are one
+# of a handful of constants; build them once instead of allocating a new
+# f-string per rendered row.
+_FEATURE_LINES = {
+    r["text"]: ("    [ ] " + r["text"], "    [x] " + r["text"])
+    for r in _ROW_TEMPLATE if r["type"] == ROW_FEATURE
+}
+_DNS_MODE_LINES = tuple(f"    < {mode} >" for mode in DNS_MODES)
+
+
+def _render_feature(row, usable_w, dns_active):
+    lines = _FEATURE_LINES.get(row["text"])
+    if lines is None:
+        text = row["text"]
+        lines = _FEATURE_LINES[text] = ("    [ ] " + text, "    [x] " + text)
+    if row["checked"]:
+        return lines[1], ATTR_CHECKED
+    return lines[0], ATTR_NORMAL
+
+
+def _render_dns(row, usable_w, dns_active):
+    if row["options"] is DNS_MODES:
+        return _DNS_MODE_LINES[row["selected"]], ATTR_NORMAL
+    return f"    < {row['options'][row['selected']]} >", ATTR_NORMAL
+
+
+def _render_dns_template(row, usable_w, dns_active):
+    if dns_active:
+        field_w = max(10, usable_w - 22)
+        scroll = row.get("scroll", 0)
+        visible_text = row["value"][scroll:scroll + field_w]
+        return f"    Template: [{visible_text}]", ATTR_NORMAL
+    return "    Template: (select custom/secure DNS)", ATTR_DIM
+
+
+_ROW_RENDERERS = {
+    ROW_HEADER: _render_header,
+    ROW_FEATURE: _render_feature,
+    ROW_DNS: _render_dns,
+    ROW_DNS_TEMPLATE: _render_dns_template,
+}
+
+
 def draw(stdscr, rows, cursor_idx, scroll_offset, focus, btn_idx,
          status_msg, status_ok, install_method="",
-         prompt_label="", prompt_buf="", prompt_cur=0):
-    """Render the full TUI screen."""
-    stdscr.erase()
-    max_y, max_x = stdscr.getmaxyx()
+         prompt_label="", prompt_buf="", prompt_cur=0,
+         max_y=None, max_x=None, dns_mode=None):
+    """Render the TUI screen, repainting only lines that changed.
+
+    The frame is composed as per-line lists of (x, text, width, attr)
+    segments and diffed against the previous frame: unchanged lines are
+    skipped entirely, so a cursor move repaints two lines instead of the
+    whole screen. Output goes through noutrefresh + doupdate so curses
+    batches the terminal writes. A terminal resize invalidates the cache
+    and forces a full repaint.
+    """
+    # Callers cache the screen size and re-query only on KEY_RESIZE;
+    # the fallback covers direct calls.
+    if max_y is None:
+        max_y, max_x = stdscr.getmaxyx()
     usable_w = max_x - 1
-
-    if install_method:
-        title = f" SlimBrave Neo - Brave Browser Debloater [{install_method}] "
-    else:
-        title = " SlimBrave Neo - Brave Browser Debloater "
-    pad = max(0, (usable_w - len(title)) // 2)
-    try:
-        stdscr.addnstr(0, 0, " " * usable_w, usable_w,
-                        curses.color_pair(CP_TITLE) | curses.A_BOLD)
-        stdscr.addnstr(0, pad, title, usable_w - pad,
-                        curses.color_pair(CP_TITLE) | curses.A_BOLD)
-    except curses.error:
-        pass
-
-    hint = " [Q/Esc] Quit  [Space/Enter] Toggle  [Tab] Buttons "
-    try:
-        stdscr.addnstr(1, 0, hint.center(usable_w), usable_w,
-                        curses.color_pair(CP_NORMAL) | curses.A_DIM)
-    except curses.error:
-        pass
+    # One shared pad string, reused across frames; per-row .ljust would
+    # allocate a fresh full-width string for every visible line.
+    blank = _blank_line(usable_w)
+
+    frame = [None] * max_y
+
+    # Title and hint depend only on the width and install method; rebuild
+    # them on resize, not per frame.
+    cc = _chrome_cache
+    if cc["key"] != (usable_w, install_method):
+        if install_method:
+            title = f" SlimBrave Neo - Brave Browser Debloater [{install_method}] "
+        else:
+            title = " SlimBrave Neo - Brave Browser Debloater "
+        pad = max(0, (usable_w - len(title)) // 2)
+        cc["title_segs"] = [(0, blank, usable_w, ATTR_TITLE),
+                            (pad, title, usable_w - pad, ATTR_TITLE)]
+        hint = " [Q/Esc] Quit  [Space/Enter] Toggle  [Tab] Buttons "
+        cc["hint_line"] = hint.center(usable_w)
+        cc["key"] = (usable_w, install_method)
+    frame[0] = cc["title_segs"]
+
+    if max_y > 1:
+        frame[1] = [(0, cc["hint_line"], usable_w, ATTR_HINT)]
+        if scroll_offset > 0:
+            frame[1].append((usable_w - 5, " ^^^ ", 5, ATTR_HINT))
 
     list_start_y = 2
     list_end_y = max_y - 4
@@ -992,169 +1418,297 @@ def draw(stdscr, rows, cursor_idx, scroll_offset, focus, btn_idx,
     if visible_count < 1:
         visible_count = 1
 
-    current_dns_mode = get_dns_mode(rows)
+    # main() tracks the DNS mode and passes it in; derive it only for
+    # direct callers.
+    if dns_mode is None:
+        dns_mode = get_dns_mode(rows)
+    dns_active = dns_mode in ("custom", "secure")
 
-    for vi in range(visible_count):
-        ri = vi + scroll_offset
-        if ri >= len(rows):
-            break
-        row = rows[ri]
-        y = list_start_y + vi
-        if y >= max_y - 3:
-            break
+    _paint_list_pad(rows, cursor_idx, focus, usable_w, dns_active, blank)
 
-        is_cursor = (focus == FOCUS_LIST and ri == cursor_idx)
+    # Viewport of the list pad: (pad top row, screen y range, last column).
+    list_rows = min(visible_count, len(rows) - scroll_offset)
+    list_last_y = min(list_start_y + list_rows - 1, max_y - 4)
+    if list_rows > 0 and list_last_y >= list_start_y:
+        pad_view = (scroll_offset, list_start_y, list_last_y, usable_w - 1)
+    else:
+        pad_view = None
 
-        line = ""
-        attr = curses.color_pair(CP_NORMAL)
+    if (scroll_offset + visible_count < len(rows)
+            and 0 <= list_end_y < max_y):
+        frame[list_end_y] = [(usable_w - 5, " vvv ", 5, ATTR_HINT)]
 
-        if row["type"] == ROW_HEADER:
-            attr = curses.color_pair(CP_HEADER) | curses.A_BOLD
-            line = f"  {row['text']}"
-        elif row["type"] == ROW_FEATURE:
-            mark = "x" if row["checked"] else " "
-            line = f"    [{mark}] {row['text']}"
-            if row["checked"]:
-                attr = curses.color_pair(CP_CHECKED)
-            else:
-                attr = curses.color_pair(CP_NORMAL)
-        elif row["type"] == ROW_DNS:
-            current = row["options"][row["selected"]]
-            line = f"    < {current} >"
-            attr = curses.color_pair(CP_NORMAL)
-        elif row["type"] == ROW_DNS_TEMPLATE:
-            tmpl_active = current_dns_mode in ("custom", "secure")
-            val = row["value"] if row["value"] else ""
-            if tmpl_active:
-                field_w = max(10, usable_w - 22)
-                scroll = row.get("scroll", 0)
-                visible_text = val[scroll:scroll + field_w]
-                line = f"    Template: [{visible_text}]"
-                attr = curses.color_pair(CP_NORMAL)
+    btn_y = max_y - 2
+    if btn_y >= 0:
+        segs = []
+        btn_x = 2
+        for i, label in enumerate(BUTTONS):
+            display = f" {label} "
+            if focus == FOCUS_BUTTONS and i == btn_idx:
+                attr = ATTR_BUTTON_FOCUS
             else:
-                line = "    Template: (select custom/secure DNS)"
-                attr = curses.color_pair(CP_DIM) | curses.A_DIM
+                attr = ATTR_BUTTON
+            segs.append((btn_x, display, usable_w - btn_x, attr))
+            btn_x += len(display) + 3
+        frame[btn_y] = segs
+
+    status_y = max_y - 1
+    if status_y >= 0:
+        if focus == FOCUS_PROMPT:
+            prompt_text = f" {prompt_label}: {prompt_buf}"
+            segs = [(0, prompt_text.ljust(usable_w), usable_w, ATTR_PROMPT)]
+            cur_x = len(prompt_label) + 3 + prompt_cur
+            if cur_x < usable_w:
+                ch = prompt_buf[prompt_cur] if prompt_cur < len(prompt_buf) else " "
+                segs.append((cur_x, ch, 1, ATTR_BUTTON_ACTIVE))
+            frame[status_y] = segs
+        elif status_msg:
+            attr = ATTR_STATUS_OK if status_ok else ATTR_STATUS_ERR
+            frame[status_y] = [(2, status_msg[:usable_w - 3],
+                                usable_w - 3, attr)]
+
+    _paint_frame(stdscr, frame, max_y, max_x, pad_view)
+
+
+# Title/hint chrome, cached per (width, install method); see draw().
+_chrome_cache = {"key": None, "title_segs": None, "hint_line": ""}
+
+# Full-width blank used to pad lines out to the margin; rebuilt only
+# when the terminal width changes.
+_blank_cache = ""
 
+
+def _blank_line(width):
+    global _blank_cache
+    if len(_blank_cache) != width:
+        _blank_cache = " " * width
+    return _blank_cache
+
+
+# The feature list lives in its own pad holding every row, not just the
+# visible slice, with per-row segments cached for diffing. Rendering is
+# thereby decoupled from scrolling: a pure scroll re-blits the pad at a
+# new offset without re-rendering a single row.
+_list_pad = {"pad": None, "h": 0, "w": 0, "states": []}
+
+# Sentinel marking a pad row as never rendered; compares unequal to every
+# real state tuple (unlike e.g. 0 or (), which real states could equal).
+_LP_UNRENDERED = object()
+
+
+def _paint_list_pad(rows, cursor_idx, focus, usable_w, dns_active, blank):
+    """Render changed rows into the list pad; untouched rows cost nothing.
+
+    Each row's rendered output is a pure function of a small state tuple
+    (checked flag, DNS selection, template value/cursor, cursor focus).
+    The tuple is snapshotted per row, so an unchanged row skips not just
+    the repaint but the formatting work as well; a cursor move re-renders
+    two rows, a group toggle only the rows whose checkmarks flipped.
+    """
+    import curses
+
+    h = len(rows)
+    lp = _list_pad
+    if lp["pad"] is None or lp["h"] < h or lp["w"] != usable_w:
+        lp["pad"] = curses.newpad(h + 1, usable_w + 1)
+        lp["h"] = h
+        lp["w"] = usable_w
+        lp["states"] = [_LP_UNRENDERED] * h
+    pad = lp["pad"]
+    prev = lp["states"]
+
+    addnstr = pad.addnstr
+    cerror = curses.error
+    for ri, row in enumerate(rows):
+        row_type = row["type"]
+        is_cursor = (focus == FOCUS_LIST and ri == cursor_idx)
+
+        if row_type == ROW_FEATURE:
+            state = (row["checked"], is_cursor)
+        elif row_type == ROW_HEADER:
+            state = "header"  # text and attr are static
+        elif row_type == ROW_DNS:
+            state = (row["selected"], is_cursor)
+        else:
+            state = (row["value"], row.get("scroll", 0),
+                     row.get("cursor", 0), is_cursor, dns_active)
+        if state == prev[ri]:
+            continue
+        prev[ri] = state
+
+        line, attr = _ROW_RENDERERS[row_type](row, usable_w, dns_active)
         if is_cursor:
-            attr = curses.color_pair(CP_CURSOR) | curses.A_BOLD
+            attr = ATTR_CURSOR
 
-        try:
-            stdscr.addnstr(y, 0, line.ljust(usable_w), usable_w, attr)
-        except curses.error:
-            pass
+        segs = [(0, line, usable_w, attr)]
+        if len(line) < usable_w:
+            segs.append((len(line), blank, usable_w - len(line), attr))
 
-        if (is_cursor and row["type"] == ROW_DNS_TEMPLATE
-                and current_dns_mode in ("custom", "secure")):
+        if is_cursor and row_type == ROW_DNS_TEMPLATE and dns_active:
             tmpl_val = row["value"]
             field_start = 15
             scroll = row.get("scroll", 0)
             cur_pos = row.get("cursor", 0)
             cur_screen_pos = field_start + cur_pos - scroll
             if 0 <= cur_screen_pos < usable_w:
-                try:
-                    ch = tmpl_val[cur_pos] if cur_pos < len(tmpl_val) else " "
-                    stdscr.addnstr(y, cur_screen_pos, ch, 1,
-                                   curses.color_pair(CP_BUTTON_ACTIVE))
-                except curses.error:
-                    pass
+                ch = tmpl_val[cur_pos] if cur_pos < len(tmpl_val) else " "
+                segs.append((cur_screen_pos, ch, 1, ATTR_BUTTON_ACTIVE))
 
-    if scroll_offset > 0:
-        try:
-            stdscr.addnstr(list_start_y - 1, usable_w - 5, " ^^^ ", 5,
-                            curses.color_pair(CP_NORMAL) | curses.A_DIM)
-        except curses.error:
-            pass
-    if scroll_offset + visible_count < len(rows):
-        try:
-            stdscr.addnstr(list_end_y, usable_w - 5, " vvv ", 5,
-                            curses.color_pair(CP_NORMAL) | curses.A_DIM)
-        except curses.error:
-            pass
+        for x, text, n, seg_attr in segs:
+            try:
+                addnstr(ri, x, text, n, seg_attr)
+            except cerror:
+                pass
 
-    btn_y = max_y - 2
-    btn_x = 2
-    for i, label in enumerate(BUTTONS):
-        display = f" {label} "
-        if focus == FOCUS_BUTTONS and i == btn_idx:
-            attr = curses.color_pair(CP_BUTTON_ACTIVE) | curses.A_BOLD
-        else:
-            attr = curses.color_pair(CP_BUTTON)
-        try:
-            stdscr.addnstr(btn_y, btn_x, display, usable_w - btn_x, attr)
-        except curses.error:
-            pass
-        btn_x += len(display) + 3
 
-    status_y = max_y - 1
-    if focus == FOCUS_PROMPT:
-        prompt_text = f" {prompt_label}: {prompt_buf}"
+# Previous frame's per-line segments, so draw() can skip unchanged lines.
+# Reset whenever the screen size changes.
+_frame_cache = {"size": None, "lines": []}
+
+
+def _paint_frame(stdscr, frame, max_y, max_x, pad_view=None):
+    """Diff `frame` against the previous one and repaint changed lines."""
+    import curses
+
+    if _frame_cache["size"] != (max_y, max_x):
+        stdscr.erase()
+        _frame_cache["size"] = (max_y, max_x)
+        # False compares unequal to every segment list, forcing a repaint.
+        _frame_cache["lines"] = [False] * max_y
+    prev = _frame_cache["lines"]
+
+    addnstr = stdscr.addnstr
+    cerror = curses.error
+    for y in range(max_y):
+        segs = frame[y]
+        if segs == prev[y]:
+            continue
+        prev[y] = segs
         try:
-            stdscr.addnstr(status_y, 0, prompt_text.ljust(usable_w),
-                            usable_w, curses.color_pair(CP_TITLE))
-            cur_x = len(prompt_label) + 3 + prompt_cur
-            if cur_x < usable_w:
-                ch = prompt_buf[prompt_cur] if prompt_cur < len(prompt_buf) else " "
-                stdscr.addnstr(status_y, cur_x, ch, 1,
-                               curses.color_pair(CP_BUTTON_ACTIVE))
-        except curses.error:
-            pass
-    elif status_msg:
-        cp = CP_STATUS_OK if status_ok else CP_STATUS_ERR
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+        except cerror:
+            continue
+        if not segs:
+            continue
+        for x, text, n, attr in segs:
+            try:
+                addnstr(y, x, text, n, attr)
+            except cerror:
+                pass
+
+    stdscr.noutrefresh()
+    if pad_view is not None:
+        top, start_y, end_y, end_x = pad_view
         try:
-            stdscr.addnstr(status_y, 2, status_msg[:usable_w - 3],
-                            usable_w - 3, curses.color_pair(cp))
+            _list_pad["pad"].noutrefresh(top, 0, start_y, 0, end_y, end_x)
         except curses.error:
             pass
+    curses.doupdate()
+
 
-    stdscr.refresh()
+# chr() results for the ASCII key range, precomputed so the input paths
+# index a tuple instead of calling chr() on every printable keystroke.
+_PRINTABLE = tuple(chr(i) for i in range(128))
 
 
 def prompt_text_input(stdscr, rows, cursor_idx, scroll_offset, btn_idx,
-                      install_method, label, default=""):
+                      install_method, label, default="",
+                      max_y=None, max_x=None):
     """Show a status-line text prompt and return (ok, text) on Enter."""
-    buf = list(default)
-    cur = len(buf)
+    import curses
+
+    # Gap buffer: `left` holds the characters before the cursor, `right`
+    # the ones after it in reverse. Every edit and cursor step is then an
+    # O(1) append/pop at a list end, where list.insert/pop at the cursor
+    # would shift the tail of the buffer on each keystroke.
+    left = list(default)
+    right = []
+
+    KEY_ENTER, KEY_BACKSPACE = curses.KEY_ENTER, curses.KEY_BACKSPACE
+    KEY_DC, KEY_LEFT, KEY_RIGHT = curses.KEY_DC, curses.KEY_LEFT, curses.KEY_RIGHT
+    KEY_HOME, KEY_END = curses.KEY_HOME, curses.KEY_END
+    KEY_RESIZE = curses.KEY_RESIZE
 
     while True:
         draw(stdscr, rows, cursor_idx, scroll_offset,
              FOCUS_PROMPT, btn_idx, "", True, install_method,
-             prompt_label=label, prompt_buf="".join(buf), prompt_cur=cur)
+             prompt_label=label,
+             prompt_buf="".join(left) + "".join(reversed(right)),
+             prompt_cur=len(left),
+             max_y=max_y, max_x=max_x)
 
         key = stdscr.getch()
 
         if key == 27:
             return False, ""
-        elif key in (curses.KEY_ENTER, 10, 13):
-            return True, "".join(buf).strip()
-        elif key in (curses.KEY_BACKSPACE, 127, 8):
-            if cur > 0:
-                buf.pop(cur - 1)
-                cur -= 1
-        elif key == curses.KEY_DC:
-            if cur < len(buf):
-                buf.pop(cur)
-        elif key == curses.KEY_LEFT:
-            if cur > 0:
-                cur -= 1
-        elif key == curses.KEY_RIGHT:
-            if cur < len(buf):
-                cur += 1
-        elif key == curses.KEY_HOME:
-            cur = 0
-        elif key == curses.KEY_END:
-            cur = len(buf)
+        elif key in (KEY_ENTER, 10, 13):
+            return True, ("".join(left) + "".join(reversed(right))).strip()
+        elif key in (KEY_BACKSPACE, 127, 8):
+            if left:
+                left.pop()
+        elif key == KEY_DC:
+            if right:
+                right.pop()
+        elif key == KEY_LEFT:
+            if left:
+                right.append(left.pop())
+        elif key == KEY_RIGHT:
+            if right:
+                left.append(right.pop())
+        elif key == KEY_HOME:
+            right.extend(reversed(left))
+            del left[:]
+        elif key == KEY_END:
+            left.extend(reversed(right))
+            del right[:]
+        elif key == KEY_RESIZE:
+            # The prompt's getch consumes the resize event the main loop
+            # would otherwise see; re-query so this and later frames are
+            # composed for the new geometry. The caller re-syncs its own
+            # cached size when the prompt returns.
+            max_y, max_x = stdscr.getmaxyx()
         elif 32 <= key <= 126:
-            buf.insert(cur, chr(key))
-            cur += 1
+            left.append(_PRINTABLE[key])
+
+
+class _TuiState:
+    """Mutable per-session TUI state shared by main() and its handlers.
+
+    One slotted object instead of a web of nonlocal cells: every handler
+    reads and writes the same attributes, slot access stays cheap, and
+    the full set of loop state is enumerable in one place. A plain
+    __slots__ class rather than dataclass(slots=True) keeps dataclasses
+    off the import path.
+    """
+    __slots__ = ("cursor_pos", "cursor_idx", "scroll_offset", "focus",
+                 "btn_idx", "status_msg", "status_ok", "dirty",
+                 "dns_mode", "max_y", "max_x", "sel")
 
 
 def main(stdscr, override_installations=None):
     """Main TUI event loop."""
+    import curses
+
     curses.curs_set(0)
     init_colors()
     stdscr.keypad(True)
     stdscr.timeout(-1)
 
+    # Bind the key constants once: a LOAD_FAST per compare beats
+    # LOAD_GLOBAL + LOAD_ATTR on every keystroke of the event loop.
+    KEY_UP, KEY_DOWN = curses.KEY_UP, curses.KEY_DOWN
+    KEY_LEFT, KEY_RIGHT = curses.KEY_LEFT, curses.KEY_RIGHT
+    KEY_ENTER, KEY_RESIZE = curses.KEY_ENTER, curses.KEY_RESIZE
+    KEY_BACKSPACE, KEY_DC = curses.KEY_BACKSPACE, curses.KEY_DC
+    KEY_HOME, KEY_END = curses.KEY_HOME, curses.KEY_END
+
+    st = _TuiState()
+
+    # Screen size, re-queried only on KEY_RESIZE. getmaxyx is an ncurses
+    # round-trip and nothing else changes the size mid-session.
+    st.max_y, st.max_x = stdscr.getmaxyx()
+
     brave_info = detect_brave()
     if override_installations is not None:
         installations = override_installations
@@ -1164,226 +1718,352 @@ def main(stdscr, override_installations=None):
         install_method = brave_info["method"]
 
     rows = build_rows(installations)
-    sel = selectable_indices(rows)
-    if not sel:
+    st.sel = selectable_indices(rows)
+    header_above = header_above_map(rows)
+    if not st.sel:
         return
 
     policy = load_existing_policy(installations)
     sync_rows_with_policy(rows, policy)
 
-    cursor_pos = 0
-    cursor_idx = sel[0]
-    scroll_offset = 0
-    focus = FOCUS_LIST
-    btn_idx = 0
+    # The DNS mode changes only when the DNS row itself is mutated, so
+    # track it here instead of re-deriving it per frame and keystroke.
+    st.dns_mode = get_dns_mode(rows)
+
+    st.cursor_pos = 0
+    st.cursor_idx = st.sel[0]
+    st.scroll_offset = 0
+    st.focus = FOCUS_LIST
+    st.btn_idx = 0
 
     if brave_info["warnings"]:
-        status_msg = brave_info["warnings"][0]
-        status_ok = not brave_info["found"]
+        st.status_msg = brave_info["warnings"][0]
+        st.status_ok = not brave_info["found"]
     else:
-        status_msg = ""
-        status_ok = True
-
-    while True:
-        max_y, _ = stdscr.getmaxyx()
-        list_start_y = 2
-        list_end_y = max_y - 4
-        visible_count = max(1, list_end_y - list_start_y)
-
-        if cursor_idx < scroll_offset:
-            scroll_offset = cursor_idx
-        if cursor_idx >= scroll_offset + visible_count:
-            scroll_offset = cursor_idx - visible_count + 1
-        if cursor_idx > 0 and rows[cursor_idx - 1]["type"] == ROW_HEADER:
-            if cursor_idx - 1 < scroll_offset:
-                scroll_offset = cursor_idx - 1
-
-        draw(stdscr, rows, cursor_idx, scroll_offset, focus, btn_idx,
-             status_msg, status_ok, install_method)
-
-        key = stdscr.getch()
-        row = rows[cursor_idx]
-
-        if (focus == FOCUS_LIST
-                and row["type"] == ROW_DNS_TEMPLATE
-                and get_dns_mode(rows) in ("custom", "secure")):
-            if 32 <= key <= 126:
+        st.status_msg = ""
+        st.status_ok = True
+
+    # Redraw only when something visible changed. Repaint + refresh is
+    # the dominant per-keystroke cost, and plenty of keys are no-ops
+    # (unbound keys, KEY_UP at the top of the list, ...). Handlers set
+    # the flag when they mutate visible state; the loop clears it after
+    # drawing, which also lets a drained burst of keys share one frame.
+    st.dirty = True
+
+    # Key handlers, dispatched through a dict instead of a long if/elif
+    # ladder walked on every keystroke. Each handler mutates the loop state
+    # via nonlocal; returning True ends the session.
+
+    def _on_quit():
+        return True
+
+    def _on_up():
+        if st.focus == FOCUS_LIST:
+            if st.cursor_pos > 0:
+                st.cursor_pos -= 1
+                st.cursor_idx = st.sel[st.cursor_pos]
+                st.status_msg = ""
+                st.dirty = True
+        elif st.focus == FOCUS_BUTTONS:
+            st.focus = FOCUS_LIST
+            st.cursor_pos = len(st.sel) - 1
+            st.cursor_idx = st.sel[st.cursor_pos]
+            st.status_msg = ""
+            st.dirty = True
+
+    def _on_down():
+        if st.focus == FOCUS_LIST:
+            if st.cursor_pos < len(st.sel) - 1:
+                st.cursor_pos += 1
+                st.cursor_idx = st.sel[st.cursor_pos]
+                st.status_msg = ""
+            else:
+                st.focus = FOCUS_BUTTONS
+                st.btn_idx = 0
+                st.status_msg = ""
+            st.dirty = True
+
+    def _on_tab():
+        if st.focus == FOCUS_LIST:
+            st.focus = FOCUS_BUTTONS
+            st.btn_idx = 0
+            st.status_msg = ""
+        else:
+            st.focus = FOCUS_LIST
+            st.status_msg = ""
+        st.dirty = True
+
+    def _on_left():
+        if st.focus == FOCUS_BUTTONS:
+            if st.btn_idx > 0:
+                st.btn_idx -= 1
+                st.dirty = True
+        elif st.focus == FOCUS_LIST:
+            if _ROW_TYPES[st.cursor_idx] == ROW_DNS:
+                row = rows[st.cursor_idx]
+                row["selected"] = _DNS_PREV[row["selected"]]
+                st.dns_mode = row["options"][row["selected"]]
+                st.status_msg = ""
+                st.dirty = True
+
+    def _on_right():
+        if st.focus == FOCUS_BUTTONS:
+            if st.btn_idx < len(BUTTONS) - 1:
+                st.btn_idx += 1
+                st.dirty = True
+        elif st.focus == FOCUS_LIST:
+            if _ROW_TYPES[st.cursor_idx] == ROW_DNS:
+                row = rows[st.cursor_idx]
+                row["selected"] = _DNS_NEXT[row["selected"]]
+                st.dns_mode = row["options"][row["selected"]]
+                st.status_msg = ""
+                st.dirty = True
+
+    def _toggle_current():
+        row_type = _ROW_TYPES[st.cursor_idx]
+        if row_type == ROW_FEATURE:
+            toggle_feature_row(rows, rows[st.cursor_idx])
+            st.status_msg = ""
+            st.dirty = True
+        elif row_type == ROW_DNS:
+            row = rows[st.cursor_idx]
+            row["selected"] = _DNS_NEXT[row["selected"]]
+            st.dns_mode = row["options"][row["selected"]]
+            st.status_msg = ""
+            st.dirty = True
+
+    def _on_space():
+        if st.focus == FOCUS_LIST:
+            _toggle_current()
+
+    def _on_resize():
+        st.max_y, st.max_x = stdscr.getmaxyx()
+        st.dirty = True
+
+    # One closure per button, dispatched by index from _on_enter; each
+    # returns True to end the session.
+
+    def _btn_import():
+        ok, path = prompt_text_input(
+            stdscr, rows, st.cursor_idx, st.scroll_offset,
+            st.btn_idx, install_method,
+            "Import path (Esc=cancel)",
+            default="./Presets/", max_y=st.max_y, max_x=st.max_x)
+        # The prompt's own getch may have swallowed a KEY_RESIZE.
+        st.max_y, st.max_x = stdscr.getmaxyx()
+        if ok and path:
+            st.status_ok, st.status_msg = import_settings(rows, path)
+            st.sel = selectable_indices(rows)
+            st.dns_mode = get_dns_mode(rows)
+        else:
+            st.status_msg = "Import cancelled."
+            st.status_ok = True
+
+    def _btn_export():
+        ok, path = prompt_text_input(
+            stdscr, rows, st.cursor_idx, st.scroll_offset,
+            st.btn_idx, install_method,
+            "Export path (Esc=cancel)",
+            default="./SlimBraveNeoSettings.json",
+            max_y=st.max_y, max_x=st.max_x)
+        # The prompt's own getch may have swallowed a KEY_RESIZE.
+        st.max_y, st.max_x = stdscr.getmaxyx()
+        if ok and path:
+            st.status_ok, st.status_msg = export_settings(rows, path)
+        else:
+            st.status_msg = "Export cancelled."
+            st.status_ok = True
+
+    def _btn_apply():
+        dns_tmpl = get_dns_template(rows)
+        if st.dns_mode == "custom" and not dns_tmpl:
+            st.status_msg = "Custom DNS requires a DoH template URL."
+            st.status_ok = False
+        else:
+            st.status_ok, st.status_msg = apply_policy(rows, installations)
+
+    def _btn_reset():
+        st.status_msg = ("Reset all settings? "
+                         "Press Enter to confirm, any key to cancel.")
+        st.status_ok = True
+        # Paint the confirmation prompt before blocking on the answer.
+        # Only the status line differs from the current frame, so this
+        # draw — and the dirty redraw after the handler returns — each
+        # cost one changed line, not a full repaint.
+        draw(stdscr, rows, st.cursor_idx, st.scroll_offset,
+             st.focus, st.btn_idx, st.status_msg, st.status_ok,
+             install_method, max_y=st.max_y, max_x=st.max_x,
+             dns_mode=st.dns_mode)
+        confirm = stdscr.getch()
+        if confirm == KEY_RESIZE:
+            # Don't eat a resize as "cancel" without recording it: pick
+            # up the new geometry, then fall through to the cancel path.
+            st.max_y, st.max_x = stdscr.getmaxyx()
+        if confirm in (KEY_ENTER, 10, 13):
+            st.status_ok, st.status_msg = reset_policy(rows, installations)
+            st.dns_mode = get_dns_mode(rows)
+        else:
+            st.status_msg = "Reset cancelled."
+            st.status_ok = True
+
+    def _btn_quit():
+        return True
+
+    # Order must mirror BUTTONS / the BTN_* constants.
+    btn_handlers = (_btn_import, _btn_export, _btn_apply, _btn_reset,
+                    _btn_quit)
+
+    def _on_enter():
+        if st.focus == FOCUS_LIST:
+            _toggle_current()
+            return
+        if st.focus != FOCUS_BUTTONS:
+            return
+        st.dirty = True
+        return btn_handlers[st.btn_idx]()
+
+    handlers = {
+        ord("q"): _on_quit,
+        27: _on_quit,
+        KEY_UP: _on_up,
+        KEY_DOWN: _on_down,
+        ord("\t"): _on_tab,
+        KEY_LEFT: _on_left,
+        KEY_RIGHT: _on_right,
+        ord(" "): _on_space,
+        KEY_RESIZE: _on_resize,
+        KEY_ENTER: _on_enter,
+        10: _on_enter,
+        13: _on_enter,
+    }
+    _handlers_get = handlers.get
+
+    def _edit_template(key):
+        """Treat `key` as a DoH-template edit; return True if consumed.
+
+        The template stays a plain str in row["value"]: that field is
+        read directly by export/apply and the test suite, and a DoH URL
+        is short enough that the one str rebuild per edit is noise next
+        to the redraw. A mutable byte/gap buffer here would buy nothing
+        and cost a str round-trip on every read.
+        """
+        row = rows[st.cursor_idx]
+        if 32 <= key <= 126:
+            val = row["value"]
+            cur = row["cursor"]
+            row["value"] = val[:cur] + _PRINTABLE[key] + val[cur:]
+            row["cursor"] = cur + 1
+            field_w = max(10, st.max_x - 1 - 22)
+            if row["cursor"] - row["scroll"] >= field_w:
+                row["scroll"] = row["cursor"] - field_w + 1
+            st.status_msg = ""
+            st.dirty = True
+            return True
+        if key in (KEY_BACKSPACE, 127, 8):
+            if row["cursor"] > 0:
                 val = row["value"]
                 cur = row["cursor"]
-                row["value"] = val[:cur] + chr(key) + val[cur:]
-                row["cursor"] = cur + 1
-                _, max_x = stdscr.getmaxyx()
-                field_w = max(10, max_x - 1 - 22)
+                row["value"] = val[:cur - 1] + val[cur:]
+                row["cursor"] = cur - 1
+                if row["scroll"] > 0:
+                    row["scroll"] -= 1
+                st.status_msg = ""
+                st.dirty = True
+            return True
+        if key == KEY_DC:
+            val = row["value"]
+            cur = row["cursor"]
+            if cur < len(val):
+                row["value"] = val[:cur] + val[cur + 1:]
+                st.status_msg = ""
+                st.dirty = True
+            return True
+        if key == KEY_LEFT:
+            if row["cursor"] > 0:
+                row["cursor"] -= 1
+                if row["cursor"] < row["scroll"]:
+                    row["scroll"] = row["cursor"]
+                st.dirty = True
+            return True
+        if key == KEY_RIGHT:
+            if row["cursor"] < len(row["value"]):
+                row["cursor"] += 1
+                field_w = max(10, st.max_x - 1 - 22)
                 if row["cursor"] - row["scroll"] >= field_w:
                     row["scroll"] = row["cursor"] - field_w + 1
-                status_msg = ""
-                continue
-            elif key in (curses.KEY_BACKSPACE, 127, 8):
-                if row["cursor"] > 0:
-                    val = row["value"]
-                    cur = row["cursor"]
-                    row["value"] = val[:cur - 1] + val[cur:]
-                    row["cursor"] = cur - 1
-                    if row["scroll"] > 0:
-                        row["scroll"] -= 1
-                    status_msg = ""
-                continue
-            elif key == curses.KEY_DC:
-                val = row["value"]
-                cur = row["cursor"]
-                if cur < len(val):
-                    row["value"] = val[:cur] + val[cur + 1:]
-                    status_msg = ""
-                continue
-            elif key == curses.KEY_LEFT:
-                if row["cursor"] > 0:
-                    row["cursor"] -= 1
-                    if row["cursor"] < row["scroll"]:
-                        row["scroll"] = row["cursor"]
-                continue
-            elif key == curses.KEY_RIGHT:
-                if row["cursor"] < len(row["value"]):
-                    row["cursor"] += 1
-                    _, max_x = stdscr.getmaxyx()
-                    field_w = max(10, max_x - 1 - 22)
-                    if row["cursor"] - row["scroll"] >= field_w:
-                        row["scroll"] = row["cursor"] - field_w + 1
-                continue
-            elif key == curses.KEY_HOME:
-                row["cursor"] = 0
-                row["scroll"] = 0
-                continue
-            elif key == curses.KEY_END:
-                row["cursor"] = len(row["value"])
-                _, max_x = stdscr.getmaxyx()
-                field_w = max(10, max_x - 1 - 22)
-                row["scroll"] = max(0, row["cursor"] - field_w + 1)
-                continue
+                st.dirty = True
+            return True
+        if key == KEY_HOME:
+            row["cursor"] = 0
+            row["scroll"] = 0
+            st.dirty = True
+            return True
+        if key == KEY_END:
+            row["cursor"] = len(row["value"])
+            field_w = max(10, st.max_x - 1 - 22)
+            row["scroll"] = max(0, row["cursor"] - field_w + 1)
+            st.dirty = True
+            return True
+        return False
+
+    def _process_key(key):
+        """Apply one key to the loop state; return True to quit."""
+        # The DoH-template field captures printable/editing keys while it
+        # has cursor focus; everything else falls through to the dispatch.
+        if (st.focus == FOCUS_LIST
+                and _ROW_TYPES[st.cursor_idx] == ROW_DNS_TEMPLATE
+                and st.dns_mode in ("custom", "secure")
+                and _edit_template(key)):
+            return False
+        handler = _handlers_get(key)
+        return handler is not None and bool(handler())
 
-        if key == ord("q") or key == 27:
+    while True:
+        if st.dirty:
+            list_start_y = 2
+            list_end_y = st.max_y - 4
+            visible_count = max(1, list_end_y - list_start_y)
+
+            # Clamp the scroll offset in one pass: raise it just enough to
+            # keep the cursor on the last visible line, then lower it to the
+            # anchor — the cursor row, or the header directly above it so a
+            # section header scrolls into view together with its first row.
+            cur = st.cursor_idx
+            anchor = cur - 1 if header_above[cur] else cur
+            st.scroll_offset = min(
+                max(st.scroll_offset, cur - visible_count + 1), anchor)
+
+            draw(stdscr, rows, st.cursor_idx, st.scroll_offset, st.focus, st.btn_idx,
+                 st.status_msg, st.status_ok, install_method,
+                 max_y=st.max_y, max_x=st.max_x, dns_mode=st.dns_mode)
+            st.dirty = False
+
+        if _process_key(stdscr.getch()):
             break
 
-        elif key == curses.KEY_UP:
-            if focus == FOCUS_LIST:
-                if cursor_pos > 0:
-                    cursor_pos -= 1
-                    cursor_idx = sel[cursor_pos]
-                    status_msg = ""
-            elif focus == FOCUS_BUTTONS:
-                focus = FOCUS_LIST
-                cursor_pos = len(sel) - 1
-                cursor_idx = sel[cursor_pos]
-                status_msg = ""
-
-        elif key == curses.KEY_DOWN:
-            if focus == FOCUS_LIST:
-                if cursor_pos < len(sel) - 1:
-                    cursor_pos += 1
-                    cursor_idx = sel[cursor_pos]
-                    status_msg = ""
-                else:
-                    focus = FOCUS_BUTTONS
-                    btn_idx = 0
-                    status_msg = ""
-            elif focus == FOCUS_BUTTONS:
-                pass
-
-        elif key == ord("\t"):
-            if focus == FOCUS_LIST:
-                focus = FOCUS_BUTTONS
-                btn_idx = 0
-                status_msg = ""
-            else:
-                focus = FOCUS_LIST
-                status_msg = ""
-
-        elif key == curses.KEY_LEFT:
-            if focus == FOCUS_BUTTONS:
-                btn_idx = max(0, btn_idx - 1)
-            elif focus == FOCUS_LIST:
-                if row["type"] == ROW_DNS:
-                    row["selected"] = (row["selected"] - 1) % len(row["options"])
-                    status_msg = ""
-
-        elif key == curses.KEY_RIGHT:
-            if focus == FOCUS_BUTTONS:
-                btn_idx = min(len(BUTTONS) - 1, btn_idx + 1)
-            elif focus == FOCUS_LIST:
-                if row["type"] == ROW_DNS:
-                    row["selected"] = (row["selected"] + 1) % len(row["options"])
-                    status_msg = ""
-
-        elif key == ord(" "):
-            if focus == FOCUS_LIST:
-                if row["type"] == ROW_FEATURE:
-                    toggle_feature_row(rows, row)
-                    status_msg = ""
-                elif row["type"] == ROW_DNS:
-                    row["selected"] = (row["selected"] + 1) % len(row["options"])
-                    status_msg = ""
-
-        elif key in (curses.KEY_ENTER, 10, 13):
-            if focus == FOCUS_BUTTONS:
-                btn_label = BUTTONS[btn_idx]
-
-                if btn_label == "Apply":
-                    dns_mode = get_dns_mode(rows)
-                    dns_tmpl = get_dns_template(rows)
-                    if dns_mode == "custom" and not dns_tmpl:
-                        status_msg = "Custom DNS requires a DoH template URL."
-                        status_ok = False
-                    else:
-                        status_ok, status_msg = apply_policy(rows, installations)
-
-                elif btn_label == "Reset":
-                    status_msg = ("Reset all settings? "
-                                  "Press Enter to confirm, any key to cancel.")
-                    status_ok = True
-                    draw(stdscr, rows, cursor_idx, scroll_offset,
-                         focus, btn_idx, status_msg, status_ok,
-                         install_method)
-                    confirm = stdscr.getch()
-                    if confirm in (curses.KEY_ENTER, 10, 13):
-                        status_ok, status_msg = reset_policy(rows, installations)
-                    else:
-                        status_msg = "Reset cancelled."
-                        status_ok = True
-
-                elif btn_label == "Import":
-                    ok, path = prompt_text_input(
-                        stdscr, rows, cursor_idx, scroll_offset,
-                        btn_idx, install_method,
-                        "Import path (Esc=cancel)",
-                        default="./Presets/")
-                    if ok and path:
-                        status_ok, status_msg = import_settings(rows, path)
-                        sel = selectable_indices(rows)
-                    else:
-                        status_msg = "Import cancelled."
-                        status_ok = True
-
-                elif btn_label == "Export":
-                    ok, path = prompt_text_input(
-                        stdscr, rows, cursor_idx, scroll_offset,
-                        btn_idx, install_method,
-                        "Export path (Esc=cancel)",
-                        default="./SlimBraveNeoSettings.json")
-                    if ok and path:
-                        status_ok, status_msg = export_settings(rows, path)
-                    else:
-                        status_msg = "Export cancelled."
-                        status_ok = True
-
-                elif btn_label == "Quit":
-                    break
-
-            elif focus == FOCUS_LIST:
-                if row["type"] == ROW_FEATURE:
-                    toggle_feature_row(rows, row)
-                    status_msg = ""
-                elif row["type"] == ROW_DNS:
-                    row["selected"] = (row["selected"] + 1) % len(row["options"])
-                    status_msg = ""
+        # Drain any already-queued keys before redrawing: a held arrow key
+        # then coalesces into one frame instead of one per autorepeat
+        # event. getch goes non-blocking only for the poll itself, so
+        # handlers that read a confirmation key still block normally.
+        quit_now = False
+        while True:
+            stdscr.nodelay(True)
+            pending = stdscr.getch()
+            stdscr.nodelay(False)
+            if pending == -1:
+                break
+            if pending == 27:
+                # A bare ESC in the drain may be the first byte of an
+                # escape sequence nodelay kept curses from assembling;
+                # push it back and let the blocking getch re-read it
+                # with normal escape-delay handling.
+                curses.ungetch(27)
+                break
+            if _process_key(pending):
+                quit_now = True
+                break
+        if quit_now:
+            break
 
 # ---------------------------------------------------------------------------
 # CLI (non-interactive)
@@ -1400,10 +2080,7 @@ def cli_import(path, installations, doh_templates=""):
     print(msg)
 
     if doh_templates:
-        for row in rows:
-            if row["type"] == ROW_DNS_TEMPLATE:
-                row["value"] = doh_templates
-                break
+        rows[_DNS_TMPL_ROW_IDX]["value"] = doh_templates
 
     ok, msg = apply_policy(rows, installations)
     if not ok:
@@ -1438,18 +2115,17 @@ def cli_reset(installations):
         print(f"No policy file found at {POLICY_FILE}")
         return 0
     try:
+        _policy_cache.clear()
         for plist_path, label in targets:
-            if os.path.exists(plist_path):
+            scope = f" ({label})" if label else ""
+            # EAFP: one unlink instead of an exists + remove pair, which
+            # also closes the race between the two calls.
+            try:
                 os.remove(plist_path)
-                print(
-                    f"Removed {plist_path}"
-                    + (f" ({label})" if label else "")
-                )
+            except FileNotFoundError:
+                print(f"No policy file found at {plist_path}{scope}")
             else:
-                print(
-                    f"No policy file found at {plist_path}"
-                    + (f" ({label})" if label else "")
-                )
+                print(f"Removed {plist_path}{scope}")
     except OSError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -1490,42 +2166,95 @@ def _filter_installations_by_channels(installations, channel_spec):
     return filtered, ""
 
 
-def parse_args():
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="slimbrave",
-        description="SlimBrave Neo - Brave Browser debloater",
-        epilog="Run without arguments to launch the interactive TUI.",
-    )
-    parser.add_argument(
-        "--import", dest="import_path", metavar="PATH",
-        help="import a SlimBrave Neo JSON config and apply policies",
-    )
-    parser.add_argument(
-        "--export", dest="export_path", metavar="PATH",
-        help="export current policy to a SlimBrave Neo JSON config",
-    )
-    parser.add_argument(
-        "--reset", action="store_true",
-        help="remove the SlimBrave Neo managed policy file",
-    )
-    parser.add_argument(
-        "--policy-file", metavar="PATH",
-        help=f"override policy file path (default: {POLICY_FILE})",
-    )
-    parser.add_argument(
-        "--doh-templates", metavar="URL",
-        help="set DnsOverHttpsTemplates (used with custom DNS mode)",
-    )
-    parser.add_argument(
-        "--channels", metavar="LIST", default="auto",
-        help=(
-            "comma-separated channels for prefs-repair / process detection "
-            f"({', '.join(CHANNEL_IDS)}). Default 'auto' = all detected. "
-            "Linux always writes a single shared policy file."
-        ),
+# Option name -> attribute on the parsed-args namespace. Everything
+# except --reset takes a value (--opt VALUE or --opt=VALUE).
+_CLI_OPTS = {
+    "--import": "import_path",
+    "--export": "export_path",
+    "--policy-file": "policy_file",
+    "--doh-templates": "doh_templates",
+    "--channels": "channels",
+}
+
+_CLI_USAGE = (
+    "usage: slimbrave [-h] [--import PATH] [--export PATH] [--reset]\n"
+    "                 [--policy-file PATH] [--doh-templates URL]\n"
+    "                 [--channels LIST]"
+)
+
+
+def _cli_help():
+    return (
+        _CLI_USAGE + "\n\n"
+        "SlimBrave Neo - Brave Browser debloater\n\n"
+        "options:\n"
+        "  -h, --help            show this help message and exit\n"
+        "  --import PATH         import a SlimBrave Neo JSON config and "
+        "apply policies\n"
+        "  --export PATH         export current policy to a SlimBrave Neo "
+        "JSON config\n"
+        "  --reset               remove the SlimBrave Neo managed policy "
+        "file\n"
+        f"  --policy-file PATH    override policy file path "
+        f"(default: {POLICY_FILE})\n"
+        "  --doh-templates URL   set DnsOverHttpsTemplates (used with "
+        "custom DNS mode)\n"
+        "  --channels LIST       comma-separated channels for prefs-repair "
+        f"/ process detection ({', '.join(CHANNEL_IDS)}). Default 'auto' = "
+        "all detected. Linux always writes a single shared policy file.\n\n"
+        "Run without arguments to launch the interactive TUI."
     )
-    return parser.parse_args()
+
+
+def parse_args():
+    """Parse command-line arguments.
+
+    A hand-rolled loop over sys.argv rather than argparse: six flat
+    options need no subcommands, groups or type coercion, and skipping
+    the argparse import keeps CLI start-up lean. Matches argparse
+    conventions where it shows: --opt=VALUE and --opt VALUE both work,
+    -h/--help prints help and exits 0, errors go to stderr with exit
+    status 2.
+    """
+    from types import SimpleNamespace
+
+    args = SimpleNamespace(import_path=None, export_path=None, reset=False,
+                           policy_file=None, doh_templates=None,
+                           channels="auto")
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_cli_help())
+            sys.exit(0)
+        if arg == "--reset":
+            args.reset = True
+            i += 1
+            continue
+        opt, eq, inline = arg.partition("=")
+        dest = _CLI_OPTS.get(opt)
+        if dest is None:
+            print(f"{_CLI_USAGE}\n"
+                  f"slimbrave: error: unrecognized arguments: {arg}",
+                  file=sys.stderr)
+            sys.exit(2)
+        if eq:
+            value = inline
+        else:
+            # A following option-like token is not a value (argparse
+            # behaved the same); --opt=VALUE covers intentional dashed
+            # values.
+            if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                print(f"{_CLI_USAGE}\n"
+                      f"slimbrave: error: argument {opt}: "
+                      "expected one argument", file=sys.stderr)
+                sys.exit(2)
+            i += 1
+            value = argv[i]
+        setattr(args, dest, value)
+        i += 1
+    return args
 
 # ---------------------------------------------------------------------------
 # Entry point
@@ -1557,12 +2286,11 @@ if __name__ == "__main__":
     is_cli = args.import_path or args.export_path or args.reset
 
     if os.geteuid() != 0:
-        print("SlimBrave Neo must be run as root.")
-        if is_cli:
-            print("Usage: sudo python3 slimbrave.py --import preset.json")
-        else:
-            print("Usage: sudo python3 slimbrave.py")
-        sys.exit(1)
+        # One sys.exit carries the whole message: it lands on stderr in a
+        # single write and the interpreter still exits with status 1.
+        usage = ("sudo python3 slimbrave.py --import preset.json"
+                 if is_cli else "sudo python3 slimbrave.py")
+        sys.exit(f"SlimBrave Neo must be run as root.\nUsage: {usage}")
 
     if is_cli:
         if override_installations is not None:
@@ -1590,6 +2318,8 @@ if __name__ == "__main__":
             rc = max(rc, cli_export(args.export_path, installations))
         sys.exit(rc)
 
+    import curses
+
     try:
         curses.wrapper(lambda s: main(s, override_installations))
     except KeyboardInterrupt:
@@ -0,0 +1,111 @@
+"""Tests for the hand-rolled argument parser in slimbrave-linux.py.
+
+The linux script parses sys.argv itself instead of using argparse, so its
+option handling, help output and error exits are pinned here. The macOS
+script still uses argparse and is not covered by this file.
+"""
+
+import importlib.util
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def _load(alias, filename):
+    spec = importlib.util.spec_from_file_location(alias, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+linux = _load("slimbrave_linux_cli", "slimbrave-linux.py")
+
+
+def _parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["slimbrave", *argv])
+    return linux.parse_args()
+
+
+def test_empty_argv_yields_defaults(monkeypatch):
+    args = _parse(monkeypatch)
+    assert vars(args) == {
+        "import_path": None,
+        "export_path": None,
+        "reset": False,
+        "policy_file": None,
+        "doh_templates": None,
+        "channels": "auto",
+    }
+
+
+def test_separate_value_form(monkeypatch):
+    args = _parse(monkeypatch, "--import", "preset.json",
+                  "--channels", "beta,nightly")
+    assert args.import_path == "preset.json"
+    assert args.channels == "beta,nightly"
+
+
+def test_equals_value_form(monkeypatch):
+    args = _parse(monkeypatch, "--export=out.json",
+                  "--doh-templates=https://dns.example/{?dns}")
+    assert args.export_path == "out.json"
+    assert args.doh_templates == "https://dns.example/{?dns}"
+
+
+def test_reset_flag(monkeypatch):
+    args = _parse(monkeypatch, "--reset")
+    assert args.reset is True
+
+
+def test_options_combine(monkeypatch):
+    args = _parse(monkeypatch, "--reset", "--policy-file=/tmp/p.json",
+                  "--export", "out.json")
+    assert args.reset is True
+    assert args.policy_file == "/tmp/p.json"
+    assert args.export_path == "out.json"
+
+
+def test_unknown_option_exits_2_with_usage(monkeypatch, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _parse(monkeypatch, "--bogus")
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "usage:" in err
+    assert "--bogus" in err
+
+
+def test_missing_value_exits_2_with_usage(monkeypatch, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _parse(monkeypatch, "--import")
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "usage:" in err
+    assert "--import" in err
+
+
+def test_option_like_value_exits_2_with_usage(monkeypatch, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _parse(monkeypatch, "--export", "--reset")
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "usage:" in err
+    assert "--export" in err
+
+
+def test_dashed_value_accepted_via_equals_form(monkeypatch):
+    args = _parse(monkeypatch, "--export=--weird-name.json")
+    assert args.export_path == "--weird-name.json"
+
+
+@pytest.mark.parametrize("flag", ["-h", "--help"])
+def test_help_exits_0_with_help_text(monkeypatch, capsys, flag):
+    with pytest.raises(SystemExit) as exc:
+        _parse(monkeypatch, flag)
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "usage:" in out
+    assert "--doh-templates" in out